@@ -7,8 +7,128 @@ removes only whole occurrences of the specified common terms (using word boundar
 tokenizes the text, and discards words shorter than three characters.
 """
 
+import hashlib
 import re
-from config import REMOVED_TERMS, STOP_WORDS
+import string
+from config import REMOVED_TERMS, get_stop_words
+
+# Bump whenever the cleaning algorithm changes in a way that affects its output,
+# so cached cleaned corpora are invalidated.
+_CLEANER_VERSION = "1"
+
+# Prefer google-re2 when available: RE2 compiles the large alternation below to a
+# DFA with linear-time matching, which is considerably faster than the stdlib
+# backtracking engine for patterns with hundreds of alternatives. Fall back to the
+# stdlib `re` module transparently if the optional dependency is not installed.
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+# Prefer pyahocorasick when available: the Aho-Corasick automaton finds every
+# occurrence of every removed term in one linear pass over the text, regardless of
+# how many terms there are, beating even a compiled regex alternation.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Precompile the removal and tokenization patterns once at import time. All terms
+# are merged into a single alternation so the text is scanned once instead of once
+# per term; terms are sorted longest-first so longer phrases win over their
+# prefixes. Case-insensitivity lives in the pattern via (?i) because google-re2's
+# compile() takes re2.Options rather than stdlib flag ints, and a bad engine must
+# never break startup, so compilation falls back to stdlib re on any failure.
+if REMOVED_TERMS:
+    _removed_pattern = (
+        r"(?i)\b(?:"
+        + "|".join(map(re.escape, sorted(REMOVED_TERMS, key=len, reverse=True)))
+        + r")\b"
+    )
+    try:
+        _REMOVED_RE = _re_engine.compile(_removed_pattern)
+    except Exception:
+        _REMOVED_RE = re.compile(_removed_pattern)
+else:
+    _REMOVED_RE = None
+
+# Translate-table tokenization: map punctuation (ASCII plus the common Unicode
+# marks that show up in scraped prose) to spaces, then split on whitespace. Both
+# steps run entirely in C, with no regex VM and no per-match objects.
+_PUNCT_TBL = str.maketrans({c: " " for c in string.punctuation + "\xa0–—‘’“”…«»"})
+
+# Build the automaton once at import; clean_text lowercases its input, so the
+# terms are stored lowercased as well.
+if ahocorasick is not None and REMOVED_TERMS:
+    _REMOVED_AUTOMATON = ahocorasick.Automaton()
+    for _term in REMOVED_TERMS:
+        _REMOVED_AUTOMATON.add_word(_term.lower(), len(_term))
+    _REMOVED_AUTOMATON.make_automaton()
+else:
+    _REMOVED_AUTOMATON = None
+
+
+def _remove_terms(text: str) -> str:
+    """
+    Remove whole-word occurrences of REMOVED_TERMS from the (lowercased) text.
+
+    Uses the Aho-Corasick automaton when pyahocorasick is installed, collecting all
+    match spans in a single pass and splicing them out; otherwise falls back to a
+    single substitution with the precompiled alternation regex.
+    """
+    if _REMOVED_AUTOMATON is None:
+        return _REMOVED_RE.sub("", text) if _REMOVED_RE is not None else text
+
+    # Collect match intervals, keeping only whole-word matches (no alphanumeric
+    # neighbor on either side) and merging overlapping spans as they arrive
+    # (matches are yielded in order of increasing end position).
+    intervals = []
+    for end, length in _REMOVED_AUTOMATON.iter(text):
+        start = end - length + 1
+        if start > 0 and text[start - 1].isalnum():
+            continue
+        if end + 1 < len(text) and text[end + 1].isalnum():
+            continue
+        if intervals and start <= intervals[-1][1] + 1:
+            intervals[-1][0] = min(intervals[-1][0], start)
+            intervals[-1][1] = end
+        else:
+            intervals.append([start, end])
+
+    # Rebuild the string from the slices between the removed intervals.
+    pieces = []
+    previous_end = 0
+    for start, end in intervals:
+        pieces.append(text[previous_end:start])
+        previous_end = end + 1
+    pieces.append(text[previous_end:])
+    return "".join(pieces)
+
+
+def cleaner_fingerprint(text: str) -> str:
+    """
+    Return a short hash identifying the cleaning configuration and its input.
+
+    The fingerprint covers the cleaner version, the REMOVED_TERMS list and the
+    raw corpus itself, so a cached cleaned corpus is invalidated when
+    removed_words.txt, the algorithm, or the scraped text changes (e.g. after the
+    raw caches are deleted to force a re-scrape). The NLTK stopword list is
+    deliberately excluded: it is stable across runs and hashing it would force
+    the nltk import on every launch.
+
+    Args:
+        text (str): The raw corpus the cleaned cache would be derived from.
+
+    Returns:
+        str: A hex digest prefix suitable for a cache sidecar file.
+    """
+    digest = hashlib.sha256(_CLEANER_VERSION.encode("utf-8"))
+    for term in REMOVED_TERMS:
+        digest.update(b"\n")
+        digest.update(term.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(text.encode("utf-8"))
+    return digest.hexdigest()[:16]
 
 
 def clean_text(text: str, remove_common_terms: bool = True, remove_stop: bool = True) -> str:
@@ -37,21 +157,16 @@ def clean_text(text: str, remove_common_terms: bool = True, remove_stop: bool =
     # Convert the text to lowercase.
     text = text.lower()
 
-    # Remove each custom domain-specific term only if it appears as a whole word.
+    # Remove all custom domain-specific terms in a single linear pass; each term
+    # still only matches as a whole word.
     if remove_common_terms:
-        for term in REMOVED_TERMS:
-            # Build a pattern to match the term as a whole word, using word boundaries (\b).
-            pattern = r"\b" + re.escape(term) + r"\b"
-            text = re.sub(pattern, "", text, flags=re.IGNORECASE)
-
-    # Tokenize the text into words, selecting only alphanumeric characters.
-    words = re.findall(r'\w+', text)
-
-    # Filter out words that are shorter than three characters and, optionally, any stopwords.
-    filtered_words = [
-        word for word in words
-        if len(word) >= 3 and (word not in STOP_WORDS if remove_stop else True)
-    ]
-
-    # Return the cleaned words joined by a single space.
-    return " ".join(filtered_words)
+        text = _remove_terms(text)
+
+    # Tokenize by mapping punctuation to spaces and splitting on whitespace; the
+    # loop-invariant remove_stop branch is hoisted out of the filter so each token
+    # only pays for the checks it needs.
+    tokens = text.translate(_PUNCT_TBL).split()
+    if remove_stop:
+        stop_words = get_stop_words()
+        return " ".join(word for word in tokens if len(word) >= 3 and word not in stop_words)
+    return " ".join(word for word in tokens if len(word) >= 3)
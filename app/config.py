@@ -9,8 +9,6 @@ the base URL, and ensures that required resources (like NLTK stopwords) are avai
 
 import os
 import logging
-import nltk
-from nltk.corpus import stopwords
 
 # Determine the project root directory (one level above this file)
 ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -18,8 +16,11 @@ ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 # File paths in the project root
 CACHE_KEYWORDS = os.path.join(ROOT_DIR, "keywords.txt")
 CACHE_DESCRIPTIONS = os.path.join(ROOT_DIR, "descriptions.txt")
+CACHE_KEYWORDS_CLEAN = os.path.join(ROOT_DIR, "keywords_clean.txt")
+CACHE_DESCRIPTIONS_CLEAN = os.path.join(ROOT_DIR, "descriptions_clean.txt")
 COMMON_TERMS_FILE = os.path.join(ROOT_DIR, "removed_words.txt")
 SCRAPER_LOG = os.path.join(ROOT_DIR, "scraper.log")
+HTTP_CACHE = os.path.join(ROOT_DIR, "http_cache.sqlite")
 
 # The base URL for faculty pages.
 BASE_URL = "https://midas.umich.edu/people/affiliated-faculty/"
@@ -43,9 +44,32 @@ formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
 console.setFormatter(formatter)
 logging.getLogger().addHandler(console)
 
-# Download NLTK stopwords quietly and set up the stop words set.
-nltk.download("stopwords", quiet=True)
-STOP_WORDS = set(stopwords.words("english"))
+# NLTK stopwords are loaded lazily so runs that never clean text skip the nltk
+# import and corpus download entirely. A frozenset is used since the set is never
+# mutated and membership tests are on the hot path.
+STOP_WORDS = None
+
+
+def get_stop_words() -> frozenset:
+    """
+    Return the NLTK English stopwords, downloading the corpus on first use.
+
+    Returns:
+        frozenset: The lowercased English stopwords, cached for the process.
+    """
+    global STOP_WORDS
+    if STOP_WORDS is None:
+        from nltk.corpus import stopwords
+        try:
+            words = stopwords.words("english")
+        except LookupError:
+            # Only hit the downloader when the corpus is genuinely absent;
+            # nltk.download re-checks its index even for corpora already on disk.
+            import nltk
+            nltk.download("stopwords", quiet=True)
+            words = stopwords.words("english")
+        STOP_WORDS = frozenset(words)
+    return STOP_WORDS
 
 # Load custom domain-specific terms to remove from text.
 if os.path.exists(COMMON_TERMS_FILE):
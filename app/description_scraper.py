@@ -5,15 +5,17 @@ Contains functions for parsing faculty links and scraping research descriptions
 from faculty profile pages.
 """
 
-import re
+import asyncio
+import io
 import string
-from tqdm import tqdm
-from bs4 import BeautifulSoup
+import sys
+from tqdm.asyncio import tqdm_asyncio
+from selectolax.parser import HTMLParser
 from config import BASE_URL
-from utils import fetch_page
+from utils import fetch_page, find_max_page, page_is_empty
 
-# Ensure BASE_URL is available
-BASE_URL = "https://midas.umich.edu/people/affiliated-faculty/"
+# Bound on concurrent faculty-profile fetches, shared across all letters.
+_FACULTY_SEM = asyncio.Semaphore(16)
 
 
 def parse_faculty_links(html: str) -> list:
@@ -26,50 +28,51 @@ def parse_faculty_links(html: str) -> list:
     Returns:
         list: A list of URLs (strings) for faculty profiles.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    tree = HTMLParser(html)
     links = []
-    for h3 in soup.find_all("h3", class_=re.compile("type-directory-title")):
-        a_tag = h3.find("a")
-        if a_tag and a_tag.get("href"):
-            links.append(a_tag["href"])
+    for a_tag in tree.css('h3[class*="type-directory-title"] a'):
+        href = a_tag.attributes.get("href")
+        if href:
+            links.append(href)
     return links
 
 
-async def scrape_descriptions_for_letter(session, letter: str) -> str:
+async def collect_faculty_links_for_letter(session, letter: str) -> list:
     """
-    Scrape research descriptions for a given alphabetical letter.
+    Collect faculty profile URLs from all listing pages for a given letter.
 
     Args:
         session (aiohttp.ClientSession): The active HTTP session.
         letter (str): The alphabetical letter to filter results.
 
     Returns:
-        str: A single string of concatenated research descriptions for the letter.
+        list: Faculty profile URLs found under this letter, in listing order.
     """
-    collected = []
-    page = 1
-    while True:
-        url = f"{BASE_URL}?_last_name_a_z={letter}&_paged={page}"
-        html = await fetch_page(session, url)
-        if not html:
-            break
-        faculty_links = parse_faculty_links(html)
-        if not faculty_links:
-            break
-        for link in tqdm(faculty_links, desc=f"Scraping descriptions for {letter} page {page}", leave=False):
-            page_html = await fetch_page(session, link)
-            if page_html:
-                soup = BeautifulSoup(page_html, "html.parser")
-                container = soup.find(class_="dynamic-entry-content")
-                if container:
-                    collected.append(container.get_text(separator=" ", strip=True))
-        page += 1
-    return " ".join(collected)
+    url = f"{BASE_URL}?_last_name_a_z={letter}&_paged=1"
+    first_html = await fetch_page(session, url)
+    if not first_html or page_is_empty(first_html):
+        return []
+    links = parse_faculty_links(first_html)
+    # Page 1's pager advertises the total page count, so the rest of the letter
+    # can be fetched in one concurrent burst instead of probing page by page.
+    max_page = find_max_page(first_html)
+    if max_page > 1:
+        pages = await asyncio.gather(*(fetch_page(session, f"{BASE_URL}?_last_name_a_z={letter}&_paged={p}")
+                                       for p in range(2, max_page + 1)))
+        for html in pages:
+            if html and not page_is_empty(html):
+                links.extend(parse_faculty_links(html))
+    return links
 
 
 async def scrape_all_descriptions(session) -> str:
     """
-    Iterate through A–Z pages and scrape all research descriptions.
+    Scrape research descriptions for all faculty profiles.
+
+    The A–Z listing pages are walked concurrently to collect profile URLs, which
+    are then deduplicated globally so each profile is fetched exactly once even if
+    it shows up under several listings, and finally all unique profiles are
+    fetched in parallel.
 
     Args:
         session (aiohttp.ClientSession): The active HTTP session.
@@ -77,8 +80,33 @@ async def scrape_all_descriptions(session) -> str:
     Returns:
         str: A single string of concatenated research descriptions.
     """
-    texts = []
-    for letter in tqdm(string.ascii_uppercase, desc="Scraping descriptions", unit="letter"):
-        letter_text = await scrape_descriptions_for_letter(session, letter)
-        texts.append(letter_text)
-    return " ".join(texts)
+    sem = asyncio.Semaphore(8)
+
+    async def collect_letter(letter: str) -> list:
+        async with sem:
+            return await collect_faculty_links_for_letter(session, letter)
+
+    per_letter = await tqdm_asyncio.gather(*(collect_letter(letter) for letter in string.ascii_uppercase),
+                                           desc="Collecting faculty links", unit="letter",
+                                           mininterval=1.0, disable=not sys.stderr.isatty())
+
+    # Deduplicate across letters while preserving first-seen order.
+    unique_links = list(dict.fromkeys(link for links in per_letter for link in links))
+
+    # Stream extracted text into one shared buffer instead of accumulating a list
+    # and paying a second full-corpus copy in " ".join at the end. Consuming the
+    # fetches with as_completed lets each page be parsed while the remaining
+    # downloads are still in flight, instead of parsing only after the last
+    # response has arrived.
+    buf = io.StringIO()
+    tasks = [asyncio.ensure_future(fetch_page(session, link, sem=_FACULTY_SEM))
+             for link in unique_links]
+    for future in tqdm_asyncio.as_completed(tasks, desc="Scraping faculty profiles", unit="page",
+                                            mininterval=1.0, disable=not sys.stderr.isatty()):
+        page_html = await future
+        if page_html:
+            container = HTMLParser(page_html).css_first(".dynamic-entry-content")
+            if container is not None:
+                buf.write(container.text(separator=" ", strip=True))
+                buf.write(" ")
+    return buf.getvalue()
@@ -5,22 +5,23 @@ Contains the asynchronous function to scrape keywords (short descriptions)
 from the paginated A–Z faculty pages.
 """
 
+import asyncio
+import io
 import string
-from tqdm import tqdm
-from bs4 import BeautifulSoup
+import sys
+from tqdm.asyncio import tqdm_asyncio
+from selectolax.parser import HTMLParser
 from config import BASE_URL
-from utils import fetch_page
-
-# Base URL remains defined in config.py; if not already present, add below.
-BASE_URL = "https://midas.umich.edu/people/affiliated-faculty/"
+from utils import fetch_page, find_max_page, page_is_empty
 
 
 async def scrape_keywords(session, verbose: bool = False) -> str:
     """
     Scrape keywords from paginated A–Z pages.
 
-    For each alphabetical letter, pages are fetched until a "nothing found" message
-    or absence of keyword paragraphs is detected.
+    All letters are scraped concurrently (bounded by a semaphore to stay polite to
+    the server); within each letter, pages are fetched until a "nothing found"
+    message or absence of keyword paragraphs is detected.
 
     Args:
         session (aiohttp.ClientSession): The active HTTP session.
@@ -29,28 +30,45 @@ async def scrape_keywords(session, verbose: bool = False) -> str:
     Returns:
         str: A single string of concatenated keywords.
     """
-    texts = []
-    for letter in tqdm(string.ascii_uppercase, desc="Alphabetical Letters", unit="letter"):
-        page = 1
-        with tqdm(desc=f"Letter {letter} pages", unit="page", leave=False) as page_bar:
-            while True:
-                url = f"{BASE_URL}?_last_name_a_z={letter}&_paged={page}"
-                if verbose:
-                    print(f"Fetching URL: {url}")
-                html = await fetch_page(session, url)
-                if not html:
-                    break
-                soup = BeautifulSoup(html, "html.parser")
-                no_results = soup.find("p", class_="facetwp-no-results")
-                if no_results and "nothing found" in no_results.get_text(strip=True).lower():
-                    break
-                paragraphs = soup.find_all("p", class_="type-directory-subtitle")
-                if not paragraphs:
-                    break
-                for p in paragraphs:
-                    txt = p.get_text(separator=" ", strip=True)
-                    if txt:
-                        texts.append(txt)
-                page += 1
-                page_bar.update(1)
-    return " ".join(texts)
+    sem = asyncio.Semaphore(8)
+    # Stream extracted text into one shared buffer instead of accumulating a list
+    # and paying a second full-corpus copy in " ".join at the end.
+    buf = io.StringIO()
+
+    def extract_keywords(html: str) -> None:
+        if page_is_empty(html):
+            return
+        tree = HTMLParser(html)
+        for p in tree.css("p.type-directory-subtitle"):
+            txt = p.text(separator=" ", strip=True)
+            if txt:
+                buf.write(txt)
+                buf.write(" ")
+
+    async def scrape_letter(letter: str) -> None:
+        async with sem:
+            url = f"{BASE_URL}?_last_name_a_z={letter}&_paged=1"
+            if verbose:
+                print(f"Fetching URL: {url}")
+            first_html = await fetch_page(session, url)
+            if first_html:
+                extract_keywords(first_html)
+                # Page 1's pager advertises the total page count, so the rest of
+                # the letter can be fetched in one concurrent burst instead of
+                # probing page after page until "nothing found".
+                max_page = find_max_page(first_html)
+                if max_page > 1:
+                    urls = [f"{BASE_URL}?_last_name_a_z={letter}&_paged={p}"
+                            for p in range(2, max_page + 1)]
+                    if verbose:
+                        for u in urls:
+                            print(f"Fetching URL: {u}")
+                    pages = await asyncio.gather(*(fetch_page(session, u) for u in urls))
+                    for html in pages:
+                        if html:
+                            extract_keywords(html)
+
+    await tqdm_asyncio.gather(*(scrape_letter(letter) for letter in string.ascii_uppercase),
+                              desc="Alphabetical Letters", unit="letter",
+                              mininterval=1.0, disable=not sys.stderr.isatty())
+    return buf.getvalue()
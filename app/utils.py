@@ -2,37 +2,96 @@
 utils.py
 --------
 Contains utility functions that are reused across multiple modules.
-Currently includes the asynchronous page-fetching function.
+Currently includes the asynchronous page-fetching function and a helper for
+reading the total page count out of FacetWP pagination markup.
 """
 
 import asyncio
 import logging
+import random
+import re
 import aiohttp
 
+# FacetWP pager links carry their target page number in a data-page attribute.
+_PAGE_NUM_RE = re.compile(r'data-page="(\d+)"')
+
+
+def page_is_empty(html: str) -> bool:
+    """
+    Cheaply detect FacetWP's "nothing found" page with substring tests on the raw
+    HTML, so callers can skip building a DOM for terminal pages entirely.
+
+    Args:
+        html (str): Listing-page HTML to inspect.
+
+    Returns:
+        bool: True if the page carries the no-results notice.
+    """
+    return "facetwp-no-results" in html and "nothing found" in html.lower()
+
+
+def find_max_page(html: str) -> int:
+    """
+    Return the highest page number advertised by the FacetWP pager in the HTML.
+
+    Args:
+        html (str): Listing-page HTML to inspect.
+
+    Returns:
+        int: The largest data-page value found, or 1 if no pager is present.
+    """
+    return max((int(num) for num in _PAGE_NUM_RE.findall(html)), default=1)
+
+
+async def _get(session: aiohttp.ClientSession, url: str) -> str:
+    """Issue one GET request and return the decoded body."""
+    async with session.get(url) as response:
+        response.raise_for_status()
+        # Read the raw body and decode it once ourselves; response.text() may
+        # fall back to slow charset detection when no charset header is present.
+        body = await response.read()
+        return body.decode(response.charset or "utf-8")
+
 
 async def fetch_page(session: aiohttp.ClientSession, url: str,
-                     retries: int = 3, delay: float = 1) -> str:
+                     retries: int = 3, delay: float = 1,
+                     sem: asyncio.Semaphore = None,
+                     max_backoff: float = 30) -> str:
     """
     Fetch the HTML content for a URL using asynchronous requests with retry logic.
 
+    Retries back off exponentially from the base delay with a little jitter so
+    concurrent failures do not retry in lockstep; when the server throttles
+    explicitly (HTTP 429/503 with a Retry-After header), that value is honored.
+
     Args:
         session (aiohttp.ClientSession): The active HTTP session.
         url (str): The URL to fetch.
         retries (int): Number of retry attempts.
-        delay (float): Seconds to wait between retries.
+        delay (float): Base seconds for the exponential backoff between retries.
+        sem (asyncio.Semaphore): Optional bound on concurrent requests, held only
+            while a request is in flight.
+        max_backoff (float): Upper bound in seconds on the wait between retries.
 
     Returns:
         str: HTML content if successful; otherwise, an empty string.
     """
     for attempt in range(retries):
         try:
-            async with session.get(url) as response:
-                response.raise_for_status()
-                return await response.text()
+            if sem is None:
+                return await _get(session, url)
+            async with sem:
+                return await _get(session, url)
         except Exception as e:
+            wait = min(max_backoff, delay * 2 ** attempt) + random.uniform(0, 0.5)
+            if isinstance(e, aiohttp.ClientResponseError) and e.status in (429, 503):
+                retry_after = (e.headers or {}).get("Retry-After")
+                if retry_after and retry_after.isdigit():
+                    wait = min(max_backoff, float(retry_after))
             logging.warning(
-                f"Error fetching {url}: {e} (attempt {attempt + 1}/{retries})"
+                f"Error fetching {url}: {e} "
+                f"(attempt {attempt + 1}/{retries}, retrying in {wait:.1f}s)"
             )
-            await asyncio.sleep(delay)
+            await asyncio.sleep(wait)
     logging.error(f"Failed to fetch {url} after {retries} attempts.")
     return ""